@@ -1,10 +1,14 @@
 """Sentence Transformers embeddings provider implementation."""
 
-from typing import TYPE_CHECKING
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from .base import EmbeddingProvider
 
 if TYPE_CHECKING:
+    import numpy as np
     from sentence_transformers import SentenceTransformer
 
 # Flag to check if sentence-transformers is available
@@ -57,6 +61,12 @@ class SentenceTransformersEmbeddingProvider(EmbeddingProvider):
             self.model = SentenceTransformer(model_name, device=device)
         
         super().__init__(model_name, dimensions)
+        
+        # Encoding is compute bound; run it off the event loop on a single
+        # worker thread so calls into the model are serialized
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sentence-transformers"
+        )
     
     async def embed_text(self, text: str) -> list[float]:
         """Embed a single text using Sentence Transformers.
@@ -68,7 +78,7 @@ class SentenceTransformersEmbeddingProvider(EmbeddingProvider):
             Embedding vector
         """
         # Convert to numpy array and then to list
-        embedding = self.model.encode(text, convert_to_numpy=True)
+        embedding = await self._encode(text)
         return embedding.tolist()
     
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
@@ -84,12 +94,32 @@ class SentenceTransformersEmbeddingProvider(EmbeddingProvider):
             return []
         
         # Batch encode for efficiency
-        embeddings = self.model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+        embeddings = await self._encode(texts, show_progress_bar=False)
         
         # Convert numpy array to list of lists
         return embeddings.tolist()
     
+    async def _encode(self, inputs: str | list[str], **kwargs: Any) -> "np.ndarray":
+        """Run the model on the encoding thread without blocking the event loop.
+        
+        Args:
+            inputs: Text or texts to encode
+            **kwargs: Additional arguments for SentenceTransformer.encode
+            
+        Returns:
+            Embedding array
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(self.model.encode, inputs, convert_to_numpy=True, **kwargs),
+        )
+    
     @property
     def provider_name(self) -> str:
         """Get the provider name."""
-        return "sentence-transformers"
\ No newline at end of file
+        return "sentence-transformers"
+    
+    async def close(self) -> None:
+        """Shut down the encoding thread."""
+        self._executor.shutdown(wait=False)
\ No newline at end of file
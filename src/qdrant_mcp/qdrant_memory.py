@@ -1,22 +1,97 @@
 """Qdrant client wrapper with embedding support."""
 
+import asyncio
+import hashlib
+import time
 import uuid
-from datetime import datetime
-from typing import Any
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, cast
 
+import httpx
+import numpy as np
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
     MatchValue,
+    OptimizersConfigDiff,
+    PayloadSchemaType,
     PointStruct,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    ScoredPoint,
+    SearchParams,
+    SearchRequest,
     VectorParams,
 )
 
 from .embeddings import create_embedding_provider
 from .settings import Settings
 
+# Payload fields returned with search hits
+RESULT_PAYLOAD_FIELDS = ["content", "timestamp", "metadata"]
+
+# Maximum number of point IDs sent in a single delete request
+DELETE_CHUNK_SIZE = 1000
+
+# Filters expected to match less than this fraction of points use exact search
+EXACT_SEARCH_SELECTIVITY = 0.01
+
+# Qdrant's default indexing threshold, restored after a bulk load when the
+# collection did not set its own
+DEFAULT_INDEXING_THRESHOLD = 20000
+
+
+def _unit_vector(embedding: list[float]) -> np.ndarray:
+    """Normalize an embedding so dot products give cosine similarity."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def parse_point_id(id: str) -> str | int:
+    """Validate a point ID, converting unsigned integer strings to ``int``.
+    
+    Qdrant only accepts UUIDs and unsigned integers, and does not match
+    numeric IDs given as strings.
+    
+    Args:
+        id: Point ID as given by the caller
+        
+    Returns:
+        The UUID string or the integer ID
+        
+    Raises:
+        ValueError: If the ID is neither a UUID nor an unsigned integer
+    """
+    # str.isdigit also accepts non-ASCII digits, which int() would convert
+    if id.isascii() and id.isdigit():
+        return int(id)
+    try:
+        uuid.UUID(id)
+    except ValueError:
+        raise ValueError(
+            f"Invalid ID: {id!r}. IDs must be UUIDs or unsigned integers"
+        )
+    return id
+
+
+def _fail_pending(batch: list[tuple], error: BaseException) -> None:
+    """Set ``error`` on the unfinished futures of queued requests.
+    
+    Args:
+        batch: Queued request tuples, each ending with its future
+        error: Exception to raise in the waiting callers
+    """
+    for *_, future in batch:
+        if not future.done():
+            future.set_exception(error)
+
 
 class QdrantMemoryClient:
     """Wrapper around Qdrant client with embedding support."""
@@ -28,30 +103,50 @@ class QdrantMemoryClient:
             settings: Application settings
         """
         self.settings = settings
-        # Parse URL to extract host and port
-        from urllib.parse import urlparse
-        parsed_url = urlparse(settings.qdrant_url)
-        host = parsed_url.hostname
-        port = parsed_url.port
-        https = parsed_url.scheme == "https"
+        host = settings.qdrant_host
+        port = settings.qdrant_port
+        https = settings.qdrant_https
+        
+        # Size the REST connection pool for concurrent requests; gRPC
+        # multiplexes them over a single HTTP/2 channel
+        limits = httpx.Limits(
+            max_connections=settings.pool_size,
+            max_keepalive_connections=settings.pool_size,
+        )
         
         # Use host/port parameters instead of URL for better compatibility
-        if host:
+        if host and https:
+            # Keep REST for HTTPS (better proxy/TLS support), over HTTP/2
+            self.client = AsyncQdrantClient(
+                host=host,
+                port=port or 443,
+                https=True,
+                api_key=settings.qdrant_api_key,
+                timeout=30.0,  # Increased timeout for remote server
+                prefer_grpc=False,
+                http2=True,
+                limits=limits,
+            )
+        elif host:
             self.client = AsyncQdrantClient(
                 host=host,
-                port=port or (443 if https else 6333),
-                https=https,
+                port=port or 6333,
+                grpc_port=settings.qdrant_grpc_port,
+                https=False,
                 api_key=settings.qdrant_api_key,
                 timeout=30.0,  # Increased timeout for remote server
-                prefer_grpc=False,  # Use REST API for better HTTPS support
+                prefer_grpc=settings.prefer_grpc,
+                limits=limits,
             )
         else:
             # Fallback to URL parameter
             self.client = AsyncQdrantClient(
                 url=settings.qdrant_url,
+                grpc_port=settings.qdrant_grpc_port,
                 api_key=settings.qdrant_api_key,
                 timeout=30.0,  # Increased timeout for remote server
-                prefer_grpc=False,  # Use REST API for better HTTPS support
+                prefer_grpc=settings.prefer_grpc,
+                limits=limits,
             )
         
         # Create embedding provider
@@ -63,7 +158,35 @@ class QdrantMemoryClient:
         )
         
         # Track initialized collections
-        self._initialized_collections = set()
+        # Replaced wholesale on change so readers never see a partial update
+        self._initialized_collections: frozenset[str] = frozenset()
+        self._init_locks: dict[str, asyncio.Lock] = {}
+        
+        # Stored content embeddings keyed by content hash, in LRU order
+        self._content_cache: OrderedDict[bytes, list[float]] = OrderedDict()
+        # Query embedding cache keyed by (model, query), in LRU order
+        self._query_cache: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        # Bumped whenever a collection changes, to discard in-flight results
+        self._collection_generations: dict[str, int] = {}
+        # Recent searches as (expires_at, search_key, unit_vector, results)
+        self._semantic_cache: list[tuple[float, tuple, np.ndarray, list[dict[str, Any]]]] = []
+        
+        # Short-lived collection listing and per-collection info, as
+        # (expires_at, value)
+        self._collections_cache: tuple[float, list[str] | None] = (0.0, None)
+        self._collection_info_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        
+        # Active bulk loads per collection, as [count, indexing threshold to
+        # restore once the last one exits]
+        self._bulk_loads: dict[str, list[int]] = {}
+        self._bulk_load_locks: dict[str, asyncio.Lock] = {}
+        
+        # Pending writes, coalesced into batched embed + upsert calls
+        self._store_queue: asyncio.Queue | None = None
+        self._store_worker: asyncio.Task | None = None
+        # Pending searches, coalesced into search_batch calls
+        self._search_queue: asyncio.Queue | None = None
+        self._search_worker: asyncio.Task | None = None
     
     async def _ensure_collection(self, collection_name: str) -> None:
         """Ensure the collection exists (lazy initialization).
@@ -73,23 +196,399 @@ class QdrantMemoryClient:
         """
         if collection_name in self._initialized_collections:
             return
+        
+        # Serialize first use per collection so concurrent callers issue a
+        # single get_collections/create_collection round-trip
+        lock = self._init_locks.setdefault(collection_name, asyncio.Lock())
+        async with lock:
+            if collection_name in self._initialized_collections:
+                return
             
+            try:
+                collections = await self.client.get_collections()
+                collection_names = [c.name for c in collections.collections]
+                existing_indexes: set[str] = set()
+                
+                if collection_name not in collection_names:
+                    # Optionally keep an int8 copy of vectors in RAM for search
+                    quantization_config = None
+                    if self.settings.quantize:
+                        quantization_config = ScalarQuantization(
+                            scalar=ScalarQuantizationConfig(
+                                type=ScalarType.INT8,
+                                always_ram=True,
+                            ),
+                        )
+                    
+                    # Create collection with appropriate vector size
+                    await self.client.create_collection(
+                        collection_name=collection_name,
+                        vectors_config=VectorParams(
+                            size=self.embedding_provider.dimensions,
+                            distance=Distance.COSINE,
+                        ),
+                        quantization_config=quantization_config,
+                    )
+                    self._collections_cache = (0.0, None)
+                elif self.settings.indexed_payload_keys:
+                    info = await self.client.get_collection(collection_name)
+                    existing_indexes = set(info.payload_schema)
+                
+                # Index metadata keys used in filters so they skip full scans
+                for key in self.settings.indexed_payload_keys:
+                    field_name = f"metadata.{key}"
+                    if field_name not in existing_indexes:
+                        await self.client.create_payload_index(
+                            collection_name=collection_name,
+                            field_name=field_name,
+                            field_schema=PayloadSchemaType.KEYWORD,
+                        )
+            except Exception as e:
+                raise RuntimeError(f"Failed to initialize Qdrant collection '{collection_name}': {e}")
+            
+            self._initialized_collections = self._initialized_collections | {collection_name}
+    
+    def _ensure_store_worker(self) -> asyncio.Queue:
+        """Start the background store worker if it is not running.
+        
+        Returns:
+            Queue the worker reads pending writes from
+        """
+        # Keep an existing queue so requests already waiting on it are
+        # picked up by a restarted worker
+        if self._store_queue is None:
+            self._store_queue = asyncio.Queue()
+        queue = self._store_queue
+        if self._store_worker is None or self._store_worker.done():
+            self._store_worker = asyncio.create_task(
+                self._run_batch_worker(
+                    queue,
+                    self.settings.store_batch_size,
+                    self.settings.store_flush_ms,
+                    self.settings.pool_size,
+                    self._flush_store_batch,
+                )
+            )
+        return queue
+    
+    def _ensure_search_worker(self) -> asyncio.Queue:
+        """Start the background search worker if it is not running.
+        
+        Returns:
+            Queue the worker reads pending searches from
+        """
+        # Keep an existing queue so requests already waiting on it are
+        # picked up by a restarted worker
+        if self._search_queue is None:
+            self._search_queue = asyncio.Queue()
+        queue = self._search_queue
+        if self._search_worker is None or self._search_worker.done():
+            self._search_worker = asyncio.create_task(
+                self._run_batch_worker(
+                    queue,
+                    self.settings.search_batch_size,
+                    self.settings.search_flush_ms,
+                    self.settings.pool_size,
+                    self._flush_search_batch,
+                )
+            )
+        return queue
+    
+    @staticmethod
+    async def _run_batch_worker(
+        queue: asyncio.Queue,
+        batch_size: int,
+        flush_ms: float,
+        max_in_flight: int,
+        flush: Callable[[list[tuple]], Awaitable[None]],
+    ) -> None:
+        """Drain queued requests into batches and hand them to ``flush``.
+        
+        Each batch is flushed in its own task so the worker goes straight
+        back to draining the queue while earlier batches are in flight.
+        
+        Args:
+            queue: Queue of pending requests
+            batch_size: Maximum number of requests per batch
+            flush_ms: Time in milliseconds to wait for more requests
+            max_in_flight: Maximum number of batches flushed concurrently
+            flush: Coroutine function processing one batch
+        """
+        loop = asyncio.get_running_loop()
+        flush_delay = flush_ms / 1000
+        slots = asyncio.Semaphore(max_in_flight)
+        in_flight: set[asyncio.Task] = set()
+        
+        async def run_flush(batch: list[tuple]) -> None:
+            try:
+                await flush(batch)
+            except asyncio.CancelledError:
+                _fail_pending(batch, RuntimeError("Qdrant client closed"))
+                raise
+            except Exception as e:
+                # Keep the worker alive; only this batch's callers see the error
+                _fail_pending(batch, e)
+            finally:
+                slots.release()
+        
+        batch: list[tuple] = []
         try:
-            collections = await self.client.get_collections()
-            collection_names = [c.name for c in collections.collections]
+            while True:
+                await slots.acquire()
+                batch = [await queue.get()]
+                deadline = loop.time() + flush_delay
+                while len(batch) < batch_size:
+                    if not queue.empty():
+                        batch.append(queue.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                task = asyncio.create_task(run_flush(batch))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                batch = []
+        except asyncio.CancelledError:
+            # Fail the batch being collected and stop the ones in flight
+            _fail_pending(batch, RuntimeError("Qdrant client closed"))
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            raise
+    
+    async def _flush_store_batch(self, batch: list[tuple]) -> None:
+        """Embed and upsert a batch of queued writes.
+        
+        Args:
+            batch: Queued (collection, content, metadata, id, future) tuples
+        """
+        # Embed while making sure the target collections exist
+        collections = list(dict.fromkeys(collection for collection, *_ in batch))
+        embeddings, *init_results = await asyncio.gather(
+            self._embed_contents([content for _, content, _, _, _ in batch]),
+            *(self._ensure_collection(c) for c in collections),
+            return_exceptions=True,
+        )
+        if isinstance(embeddings, BaseException):
+            _fail_pending(batch, embeddings)
+            return
+        embeddings = cast(list[list[float]], embeddings)
+        init_errors = {
+            collection: error
+            for collection, error in zip(collections, init_results)
+            if isinstance(error, BaseException)
+        }
+        
+        # Fields shared by every point in the batch
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        model_name = self.embedding_provider.model_name
+        provider_name = self.embedding_provider.provider_name
+        
+        # Group points per collection so each gets a single upsert
+        grouped: dict[str, tuple[list[PointStruct], list[asyncio.Future]]] = {}
+        for (collection, content, metadata, point_id, future), embedding in zip(
+            batch, embeddings
+        ):
+            payload = {
+                "content": content,
+                "timestamp": timestamp,
+                "embedding_model": model_name,
+                "embedding_provider": provider_name,
+            }
+            if metadata:
+                payload["metadata"] = metadata
             
-            if collection_name not in collection_names:
-                # Create collection with appropriate vector size
-                await self.client.create_collection(
-                    collection_name=collection_name,
-                    vectors_config=VectorParams(
-                        size=self.embedding_provider.dimensions,
-                        distance=Distance.COSINE,
-                ),
+            points, futures = grouped.setdefault(collection, ([], []))
+            points.append(PointStruct(id=point_id, vector=embedding, payload=payload))
+            futures.append(future)
+        
+        # Upsert all collections concurrently
+        await asyncio.gather(
+            *(
+                self._upsert_group(collection, points, futures, init_errors.get(collection))
+                for collection, (points, futures) in grouped.items()
             )
-            self._initialized_collections.add(collection_name)
-        except Exception as e:
-            raise RuntimeError(f"Failed to initialize Qdrant collection '{collection_name}': {e}")
+        )
+    
+    async def _upsert_group(
+        self,
+        collection: str,
+        points: list[PointStruct],
+        futures: list[asyncio.Future],
+        init_error: BaseException | None,
+    ) -> None:
+        """Upsert one collection's share of a store batch and settle its futures.
+        
+        If the grouped upsert fails, the points are retried one by one so a
+        single rejected point only fails its own caller.
+        
+        Args:
+            collection: Target collection
+            points: Points to upsert
+            futures: Futures of the callers, in the order of ``points``
+            init_error: Error raised while ensuring the collection exists
+        """
+        errors: list[BaseException | None] = [init_error] * len(points)
+        if init_error is None:
+            try:
+                await self.client.upsert(collection_name=collection, points=points)
+            except Exception as e:
+                if len(points) == 1:
+                    errors = [e]
+                else:
+                    results = await asyncio.gather(
+                        *(
+                            self.client.upsert(collection_name=collection, points=[point])
+                            for point in points
+                        ),
+                        return_exceptions=True,
+                    )
+                    errors = [
+                        r if isinstance(r, BaseException) else None for r in results
+                    ]
+            if not all(errors):
+                self._invalidate_caches(collection)
+        
+        for future, error in zip(futures, errors):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+    
+    async def _embed_contents(self, contents: list[str]) -> list[list[float]]:
+        """Embed contents to store, reusing vectors of recently stored text.
+        
+        Args:
+            contents: Texts to embed
+            
+        Returns:
+            Embedding vectors in the same order as ``contents``
+        """
+        cache = self._content_cache
+        keys = [
+            hashlib.blake2b(content.encode(), digest_size=16).digest()
+            for content in contents
+        ]
+        
+        vectors: dict[bytes, list[float]] = {}
+        missing: dict[bytes, str] = {}
+        for key, content in zip(keys, contents):
+            if key in cache:
+                cache.move_to_end(key)
+                vectors[key] = cache[key]
+            else:
+                missing.setdefault(key, content)
+        
+        if missing:
+            embeddings = await self.embedding_provider.embed_batch(list(missing.values()))
+            for key, embedding in zip(missing, embeddings):
+                vectors[key] = cache[key] = embedding
+            while len(cache) > self.settings.content_cache_size:
+                cache.popitem(last=False)
+        
+        return [vectors[key] for key in keys]
+    
+    async def _flush_search_batch(self, batch: list[tuple]) -> None:
+        """Run a batch of queued searches with one request per collection.
+        
+        Args:
+            batch: Queued (collection, SearchRequest, future) tuples
+        """
+        grouped: dict[str, tuple[list[SearchRequest], list[asyncio.Future]]] = {}
+        for collection, request, future in batch:
+            requests, futures = grouped.setdefault(collection, ([], []))
+            requests.append(request)
+            futures.append(future)
+        
+        # Query all collections concurrently
+        results = await asyncio.gather(
+            *(
+                self.client.search_batch(collection_name=collection, requests=requests)
+                for collection, (requests, _) in grouped.items()
+            ),
+            return_exceptions=True,
+        )
+        for (_, futures), hits_per_request in zip(grouped.values(), results):
+            for i, future in enumerate(futures):
+                if future.done():
+                    continue
+                if isinstance(hits_per_request, BaseException):
+                    future.set_exception(hits_per_request)
+                else:
+                    future.set_result(hits_per_request[i])
+    
+    async def _embed_query(self, query: str) -> list[float]:
+        """Embed a search query, reusing vectors of recently seen queries.
+        
+        Args:
+            query: Search query text
+            
+        Returns:
+            Query embedding vector
+        """
+        key = (self.embedding_provider.model_name, query)
+        embedding = self._query_cache.get(key)
+        if embedding is not None:
+            self._query_cache.move_to_end(key)
+            return embedding
+        
+        embedding = await self.embedding_provider.embed_text(query)
+        self._query_cache[key] = embedding
+        if len(self._query_cache) > self.settings.query_cache_size:
+            self._query_cache.popitem(last=False)
+        return embedding
+    
+    def _lookup_semantic_cache(
+        self, search_key: tuple, query_vector: np.ndarray
+    ) -> list[dict[str, Any]] | None:
+        """Return cached results of a near-identical earlier search, if any.
+        
+        Args:
+            search_key: Collection and search parameters the results depend on
+            query_vector: Normalized query embedding
+            
+        Returns:
+            Cached results, or None on a miss
+        """
+        now = time.monotonic()
+        self._semantic_cache = [e for e in self._semantic_cache if e[0] > now]
+        candidates = [e for e in self._semantic_cache if e[1] == search_key]
+        if not candidates:
+            return None
+        
+        similarities = np.stack([e[2] for e in candidates]) @ query_vector
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.settings.semantic_cache_threshold:
+            return candidates[best][3]
+        return None
+    
+    def _remember_semantic_cache(
+        self,
+        search_key: tuple,
+        query_vector: np.ndarray,
+        results: list[dict[str, Any]],
+    ) -> None:
+        """Add search results to the semantic cache, evicting the oldest entry."""
+        expires_at = time.monotonic() + self.settings.semantic_cache_ttl
+        self._semantic_cache.append((expires_at, search_key, query_vector, results))
+        if len(self._semantic_cache) > self.settings.semantic_cache_size:
+            del self._semantic_cache[0]
+    
+    def _invalidate_caches(self, collection_name: str) -> None:
+        """Drop cached search results and info for a collection after it changed."""
+        self._collection_generations[collection_name] = (
+            self._collection_generations.get(collection_name, 0) + 1
+        )
+        self._collection_info_cache.pop(collection_name, None)
+        self._semantic_cache = [
+            e for e in self._semantic_cache if e[1][0] != collection_name
+        ]
     
     async def store(
         self,
@@ -97,58 +596,89 @@ class QdrantMemoryClient:
         metadata: dict[str, Any] | None = None,
         id: str | None = None,
         collection_name: str | None = None
-    ) -> dict[str, str]:
+    ) -> dict[str, Any]:
         """Store content with embeddings in Qdrant.
         
         Args:
             content: Text content to store
             metadata: Optional metadata to attach
-            id: Optional ID for the point (generated if not provided)
+            id: Optional ID for the point (generated if not provided); a UUID
+                or an unsigned integer
             collection_name: Optional collection name (uses default if not provided)
             
         Returns:
             Dictionary with ID and collection name of the stored point
+            
+        Raises:
+            ValueError: If ``id`` is neither a UUID nor an unsigned integer
         """
         # Determine target collection
         target_collection = collection_name or self.settings.default_collection_name
         
-        # Ensure collection exists
-        await self._ensure_collection(target_collection)
+        # Generate ID if not provided; validate it before it joins a batch,
+        # where Qdrant rejecting it would fail the whole upsert
+        point_id = parse_point_id(id) if id else str(uuid.uuid4())
         
-        # Generate ID if not provided
-        point_id = id or str(uuid.uuid4())
+        # Hand the write to the batching worker, which ensures the collection
+        # exists while embedding, and wait for its upsert
+        queue = self._ensure_store_worker()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        await queue.put((target_collection, content, metadata, point_id, future))
+        await future
         
-        # Generate embedding
-        embedding = await self.embedding_provider.embed_text(content)
-        
-        # Prepare payload
-        payload = {
-            "content": content,
-            "timestamp": datetime.utcnow().isoformat(),
-            "embedding_model": self.embedding_provider.model_name,
-            "embedding_provider": self.embedding_provider.provider_name,
+        return {
+            "id": point_id,
+            "collection": target_collection
         }
+    
+    async def _find_raw(
+        self,
+        collection_name: str,
+        query_embedding: list[float],
+        limit: int,
+        filter: dict[str, Any] | None,
+        score_threshold: float,
+        exact: bool = False,
+    ) -> list[ScoredPoint]:
+        """Search a collection with an embedded query.
         
-        if metadata:
-            payload["metadata"] = metadata
+        Args:
+            collection_name: Collection to search
+            query_embedding: Query embedding vector
+            limit: Number of results to return
+            filter: Optional filter conditions on metadata
+            score_threshold: Minimum score threshold
+            exact: Scan all matching points instead of walking the HNSW index
+            
+        Returns:
+            Scored points as returned by Qdrant
+        """
+        # Build filter if provided
+        search_filter = None
+        if filter:
+            search_filter = Filter(
+                must=[
+                    FieldCondition(key=f"metadata.{key}", match=MatchValue(value=value))
+                    for key, value in filter.items()
+                ]
+            )
         
-        # Create point
-        point = PointStruct(
-            id=point_id,
-            vector=embedding,
-            payload=payload,
+        # Search, batched with concurrent queries on the same collection
+        request = SearchRequest(
+            vector=query_embedding,
+            limit=limit,
+            filter=search_filter,
+            score_threshold=score_threshold,
+            params=SearchParams(exact=True) if exact else None,
+            with_payload=RESULT_PAYLOAD_FIELDS,
+            with_vector=False,
         )
-        
-        # Upsert to Qdrant
-        await self.client.upsert(
-            collection_name=target_collection,
-            points=[point],
+        queue = self._ensure_search_worker()
+        future: asyncio.Future[list[ScoredPoint]] = (
+            asyncio.get_running_loop().create_future()
         )
-        
-        return {
-            "id": point_id,
-            "collection": target_collection
-        }
+        await queue.put((collection_name, request, future))
+        return await future
     
     async def find(
         self,
@@ -156,8 +686,10 @@ class QdrantMemoryClient:
         limit: int | None = None,
         filter: dict[str, Any] | None = None,
         score_threshold: float | None = None,
-        collection_name: str | None = None
-    ) -> list[dict[str, Any]]:
+        collection_name: str | None = None,
+        exact: bool | None = None,
+        expected_selectivity: float | None = None,
+    ) -> dict[str, Any]:
         """Find similar content using semantic search.
         
         Args:
@@ -166,66 +698,93 @@ class QdrantMemoryClient:
             filter: Optional filter conditions
             score_threshold: Minimum score threshold
             collection_name: Optional collection name (uses default if not provided)
+            exact: Force (True) or disable (False) exact search; when None it is
+                enabled for highly selective filters on indexed keys
+            expected_selectivity: Optional estimate of the fraction of points
+                matching the filter, used to decide on exact search
             
         Returns:
-            List of search results with content and metadata
+            Collection name, embedding model and provider used for the query,
+            and the list of search results with content and metadata
         """
         # Determine target collection
         target_collection = collection_name or self.settings.default_collection_name
         
-        # Ensure collection exists
-        await self._ensure_collection(target_collection)
-        
         # Use defaults from settings if not provided
         limit = limit or self.settings.default_limit
         score_threshold = score_threshold or self.settings.score_threshold
         
-        # Generate query embedding
-        query_embedding = await self.embedding_provider.embed_text(query)
+        # Ensure collection exists while generating the query embedding
+        # (reused for repeated queries)
+        _, query_embedding = await asyncio.gather(
+            self._ensure_collection(target_collection),
+            self._embed_query(query),
+        )
         
-        # Build filter if provided
-        search_filter = None
-        if filter:
-            conditions = []
-            for key, value in filter.items():
-                conditions.append(
-                    FieldCondition(
-                        key=f"metadata.{key}",
-                        match=MatchValue(value=value),
-                    )
-                )
-            if conditions:
-                search_filter = Filter(must=conditions)
+        # Brute force over a small filtered subset beats an HNSW walk that has
+        # to skip past most points
+        if exact is None:
+            exact = bool(
+                filter
+                and expected_selectivity is not None
+                and expected_selectivity < EXACT_SEARCH_SELECTIVITY
+                and any(key in self.settings.indexed_payload_keys for key in filter)
+            )
         
-        # Search
-        results = await self.client.search(
-            collection_name=target_collection,
-            query_vector=query_embedding,
-            limit=limit,
-            query_filter=search_filter,
-            score_threshold=score_threshold,
-            with_payload=True,
-            with_vectors=False,
+        # Serve semantically equivalent recent searches from cache
+        search_key = (
+            target_collection,
+            limit,
+            repr(sorted(filter.items())) if filter else None,
+            score_threshold,
+            exact,
         )
+        query_vector = None
+        formatted_results = None
+        if self.settings.semantic_cache_size:
+            query_vector = _unit_vector(query_embedding)
+            formatted_results = self._lookup_semantic_cache(search_key, query_vector)
         
-        # Format results
-        formatted_results = []
-        for result in results:
-            formatted_result = {
-                "id": result.id,
-                "score": result.score,
-                "content": result.payload.get("content", ""),
-                "timestamp": result.payload.get("timestamp", ""),
-                "metadata": result.payload.get("metadata", {}),
-                "embedding_model": result.payload.get("embedding_model", ""),
-                "embedding_provider": result.payload.get("embedding_provider", ""),
-                "collection": target_collection,
-            }
-            formatted_results.append(formatted_result)
+        if formatted_results is None:
+            generation = self._collection_generations.get(target_collection, 0)
+            results = await self._find_raw(
+                target_collection,
+                query_embedding,
+                limit,
+                filter,
+                score_threshold,
+                exact=exact,
+            )
+            
+            # Format results (payload looked up once per hit)
+            formatted_results = [
+                {
+                    "id": result.id,
+                    "score": result.score,
+                    "content": (payload := result.payload or {}).get("content", ""),
+                    "timestamp": payload.get("timestamp", ""),
+                    "metadata": payload.get("metadata", {}),
+                }
+                for result in results
+            ]
+            
+            # Results from a search that raced a write may predate it
+            if (
+                query_vector is not None
+                and self._collection_generations.get(target_collection, 0) == generation
+            ):
+                self._remember_semantic_cache(search_key, query_vector, formatted_results)
         
-        return formatted_results
+        return {
+            "collection": target_collection,
+            "embedding_model": self.embedding_provider.model_name,
+            "embedding_provider": self.embedding_provider.provider_name,
+            "results": formatted_results,
+        }
     
-    async def delete(self, ids: list[str], collection_name: str | None = None) -> dict[str, Any]:
+    async def delete(
+        self, ids: list[str | int], collection_name: str | None = None
+    ) -> dict[str, Any]:
         """Delete points by IDs.
         
         Args:
@@ -241,10 +800,22 @@ class QdrantMemoryClient:
         # Ensure collection exists
         await self._ensure_collection(target_collection)
         
-        await self.client.delete(
-            collection_name=target_collection,
-            points_selector=ids,
+        # Send large deletes as concurrent fixed-size requests
+        results = await asyncio.gather(
+            *(
+                self.client.delete(
+                    collection_name=target_collection,
+                    points_selector=ids[i:i + DELETE_CHUNK_SIZE],
+                )
+                for i in range(0, len(ids), DELETE_CHUNK_SIZE)
+            ),
+            return_exceptions=True,
         )
+        # Other shards may have succeeded even if one failed
+        self._invalidate_caches(target_collection)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         
         return {
             "deleted": len(ids),
@@ -252,14 +823,71 @@ class QdrantMemoryClient:
             "collection": target_collection,
         }
     
+    @asynccontextmanager
+    async def bulk_load(self, collection_name: str | None = None) -> AsyncIterator[str]:
+        """Defer vector indexing while loading many points into a collection.
+        
+        Indexing is disabled on entry and the collection's own threshold is
+        restored on exit, so the index is built once after the load.
+        Overlapping loads on a collection are counted, and indexing resumes
+        only when the last one exits.
+        
+        Args:
+            collection_name: Optional collection name (uses default if not provided)
+            
+        Yields:
+            Name of the collection being loaded
+        """
+        # Determine target collection
+        target_collection = collection_name or self.settings.default_collection_name
+        
+        # Ensure collection exists
+        await self._ensure_collection(target_collection)
+        
+        lock = self._bulk_load_locks.setdefault(target_collection, asyncio.Lock())
+        async with lock:
+            active = self._bulk_loads.get(target_collection)
+            if active is None:
+                info = await self.client.get_collection(target_collection)
+                threshold = info.config.optimizer_config.indexing_threshold
+                await self.client.update_collection(
+                    collection_name=target_collection,
+                    optimizer_config=OptimizersConfigDiff(indexing_threshold=0),
+                )
+                active = self._bulk_loads[target_collection] = [
+                    0,
+                    DEFAULT_INDEXING_THRESHOLD if threshold is None else threshold,
+                ]
+            active[0] += 1
+        try:
+            yield target_collection
+        finally:
+            async with lock:
+                active[0] -= 1
+                if not active[0]:
+                    del self._bulk_loads[target_collection]
+                    await self.client.update_collection(
+                        collection_name=target_collection,
+                        optimizer_config=OptimizersConfigDiff(
+                            indexing_threshold=active[1],
+                        ),
+                    )
+    
     async def list_collections(self) -> list[str]:
         """List all collections in Qdrant.
         
         Returns:
             List of collection names
         """
+        expires_at, names = self._collections_cache
+        now = time.monotonic()
+        if names is not None and expires_at > now:
+            return names
+        
         collections = await self.client.get_collections()
-        return [c.name for c in collections.collections]
+        names = [c.name for c in collections.collections]
+        self._collections_cache = (now + self.settings.collection_cache_ttl, names)
+        return names
     
     async def get_collection_info(self, collection_name: str | None = None) -> dict[str, Any]:
         """Get information about a collection.
@@ -276,17 +904,36 @@ class QdrantMemoryClient:
         # Ensure collection exists
         await self._ensure_collection(target_collection)
         
+        now = time.monotonic()
+        cached = self._collection_info_cache.get(target_collection)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
         info = await self.client.get_collection(target_collection)
-        return {
+        result = {
             "name": target_collection,
             "vectors_count": info.vectors_count,
             "points_count": info.points_count,
             "vector_size": info.config.params.vectors.size,
             "distance": info.config.params.vectors.distance,
         }
+        self._collection_info_cache[target_collection] = (
+            now + self.settings.collection_cache_ttl,
+            result,
+        )
+        return result
     
     async def close(self) -> None:
         """Close connections and cleanup."""
+        # Stop the workers (failing their in-flight batches), then fail
+        # whatever is still queued so no caller waits forever
+        workers = [w for w in (self._store_worker, self._search_worker) if w is not None]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for queue in (self._store_queue, self._search_queue):
+            while queue is not None and not queue.empty():
+                _fail_pending([queue.get_nowait()], RuntimeError("Qdrant client closed"))
         if hasattr(self.embedding_provider, "close"):
             await self.embedding_provider.close()
         await self.client.close()
\ No newline at end of file
@@ -2,22 +2,47 @@
 
 import json
 import logging
-import os
-import sys
+import re
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
+import orjson
 from mcp.server import FastMCP
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from qdrant_mcp.qdrant_memory import QdrantMemoryClient
+from qdrant_mcp.qdrant_memory import QdrantMemoryClient, parse_point_id
 from qdrant_mcp.settings import get_settings
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Splits comma and/or whitespace separated ID lists
+_split_ids = re.compile(r"[,\s]+").split
+
+# Range of integers orjson (and Qdrant payloads) represent exactly
+_INT64_MIN = -(2**63)
+_UINT64_MAX = 2**64 - 1
+
+
+def _contains_float(value: Any) -> bool:
+    """Check whether parsed JSON contains a float anywhere."""
+    if isinstance(value, float):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_float(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_contains_float(v) for v in value)
+    return False
+
+
+def _parse_int64(literal: str) -> int:
+    """Parse a JSON integer, rejecting values outside the 64-bit range."""
+    value = int(literal)
+    if not _INT64_MIN <= value <= _UINT64_MAX:
+        raise ValueError("Integer exceeds 64-bit range")
+    return value
+
+
 # Initialize Qdrant client (will be created on startup)
 qdrant_client: QdrantMemoryClient | None = None
 
@@ -45,6 +70,13 @@ async def lifespan(app: FastMCP) -> AsyncGenerator[None, None]:
             logger.info("Qdrant client closed")
 
 
+def _get_client() -> QdrantMemoryClient:
+    """Return the Qdrant client, raising if the server has not started."""
+    if qdrant_client is None:
+        raise RuntimeError("Qdrant client not initialized")
+    return qdrant_client
+
+
 # Initialize MCP with lifespan
 mcp = FastMCP("qdrant-mcp", lifespan=lifespan)
 
@@ -56,34 +88,37 @@ async def qdrant_store(content: str, metadata: str | dict[str, Any] | None = Non
     Args:
         content: The text content to store
         metadata: Optional metadata as JSON string or dict
-        id: Optional ID for the stored item
+        id: Optional ID for the stored item (a UUID or unsigned integer)
         collection_name: Optional collection name (uses default if not provided)
         
     Returns:
         ID of the stored item
     """
-    global qdrant_client
-    if not qdrant_client:
-        raise RuntimeError("Qdrant client not initialized")
+    client = _get_client()
     
     # Parse and validate metadata if provided
     metadata_dict = None
     if metadata is not None:
         try:
             if isinstance(metadata, dict):
-                # Validate dict can be JSON serialized
-                json.dumps(metadata)
+                # Validate dict can be JSON serialized (datetimes are rejected
+                # like the stdlib encoder does, rather than coerced to strings)
+                orjson.dumps(metadata, option=orjson.OPT_PASSTHROUGH_DATETIME)
                 metadata_dict = metadata
             elif isinstance(metadata, str):
                 # Validate and parse JSON string
-                metadata_dict = json.loads(metadata)
+                metadata_dict = orjson.loads(metadata)
+                # orjson reads integers wider than 64 bits as floats; re-parse
+                # with the stdlib to reject them like the dict path does
+                if _contains_float(metadata_dict):
+                    metadata_dict = json.loads(metadata, parse_int=_parse_int64)
             else:
                 raise ValueError(
                     "Metadata format error. Please provide metadata as:\n"
                     "- JSON string: '{\"key\": \"value\"}'\n"
                     "- Python dict: {'key': 'value'}"
                 )
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in metadata: {e}")
         except (TypeError, ValueError) as e:
             if "not JSON serializable" in str(e) or "Object of type" in str(e):
@@ -94,7 +129,7 @@ async def qdrant_store(content: str, metadata: str | dict[str, Any] | None = Non
             raise ValueError(f"Invalid metadata: {e}")
     
     # Store in Qdrant
-    result = await qdrant_client.store(
+    result = await client.store(
         content=content,
         metadata=metadata_dict,
         id=id,
@@ -110,8 +145,10 @@ async def qdrant_find(
     limit: int | None = None,
     filter: str | None = None,
     score_threshold: float | None = None,
-    collection_name: str | None = None
-) -> list[dict[str, Any]]:
+    collection_name: str | None = None,
+    exact: bool | None = None,
+    expected_selectivity: float | None = None
+) -> dict[str, Any]:
     """Find relevant information using semantic search.
     
     Args:
@@ -120,29 +157,35 @@ async def qdrant_find(
         filter: Optional JSON string with filter conditions
         score_threshold: Minimum similarity score (0-1)
         collection_name: Optional collection name (uses default if not provided)
+        exact: Optional flag to scan all matching points instead of using the
+            vector index; useful with filters that match few points
+        expected_selectivity: Optional estimate of the fraction of points (0-1)
+            matching the filter; when exact is not given, very selective
+            filters on indexed keys use exact search
         
     Returns:
-        List of matching results with content and metadata
+        Collection name, embedding model and provider, and the list of
+        matching results with content and metadata
     """
-    global qdrant_client
-    if not qdrant_client:
-        raise RuntimeError("Qdrant client not initialized")
+    client = _get_client()
     
     # Parse filter if provided
     filter_dict = None
     if filter:
         try:
-            filter_dict = json.loads(filter)
-        except json.JSONDecodeError:
+            filter_dict = orjson.loads(filter)
+        except orjson.JSONDecodeError:
             raise ValueError("Filter must be valid JSON")
     
     # Search in Qdrant
-    results = await qdrant_client.find(
+    results = await client.find(
         query=query,
         limit=limit,
         filter=filter_dict,
         score_threshold=score_threshold,
-        collection_name=collection_name
+        collection_name=collection_name,
+        exact=exact,
+        expected_selectivity=expected_selectivity
     )
     
     return results
@@ -153,24 +196,25 @@ async def qdrant_delete(ids: str, collection_name: str | None = None) -> dict[st
     """Delete items from Qdrant by their IDs.
     
     Args:
-        ids: Comma-separated list of IDs to delete
+        ids: Comma- or whitespace-separated list of IDs (UUIDs or unsigned integers)
         collection_name: Optional collection name (uses default if not provided)
         
     Returns:
         Deletion result
     """
-    global qdrant_client
-    if not qdrant_client:
-        raise RuntimeError("Qdrant client not initialized")
+    client = _get_client()
     
     # Parse IDs
-    id_list = [id.strip() for id in ids.split(",") if id.strip()]
+    id_list = [id for id in _split_ids(ids) if id]
     
     if not id_list:
         raise ValueError("No IDs provided")
     
+    # Reject malformed IDs before the round-trip to Qdrant
+    point_ids = [parse_point_id(id) for id in id_list]
+    
     # Delete from Qdrant
-    result = await qdrant_client.delete(id_list, collection_name=collection_name)
+    result = await client.delete(point_ids, collection_name=collection_name)
     
     return result
 
@@ -182,11 +226,9 @@ async def qdrant_list_collections() -> list[str]:
     Returns:
         List of collection names
     """
-    global qdrant_client
-    if not qdrant_client:
-        raise RuntimeError("Qdrant client not initialized")
+    client = _get_client()
     
-    return await qdrant_client.list_collections()
+    return await client.list_collections()
 
 
 @mcp.tool()
@@ -199,11 +241,9 @@ async def qdrant_collection_info(collection_name: str | None = None) -> dict[str
     Returns:
         Collection statistics and configuration
     """
-    global qdrant_client
-    if not qdrant_client:
-        raise RuntimeError("Qdrant client not initialized")
+    client = _get_client()
     
-    return await qdrant_client.get_collection_info(collection_name=collection_name)
+    return await client.get_collection_info(collection_name=collection_name)
 
 
 def main() -> None:
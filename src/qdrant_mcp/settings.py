@@ -1,8 +1,9 @@
 """Settings management for Qdrant MCP server."""
 
 from typing import Literal
+from urllib.parse import urlparse
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -29,6 +30,27 @@ class Settings(BaseSettings):
         default="mcp_memory",
         description="Default Qdrant collection name to use when not specified"
     )
+    prefer_grpc: bool = Field(
+        default=True,
+        description="Use gRPC instead of REST for plain (non-HTTPS) Qdrant URLs"
+    )
+    qdrant_grpc_port: int = Field(
+        default=6334,
+        description="gRPC port of the Qdrant server"
+    )
+    pool_size: int = Field(
+        default=100,
+        ge=1,
+        description="Number of pooled REST connections to Qdrant"
+    )
+    quantize: bool = Field(
+        default=False,
+        description="Create new collections with int8 scalar quantization"
+    )
+    indexed_payload_keys: list[str] = Field(
+        default_factory=list,
+        description="Metadata keys to create keyword payload indexes for"
+    )
     
     # Embedding settings
     embedding_provider: Literal["openai", "sentence-transformers"] = Field(
@@ -52,6 +74,23 @@ class Settings(BaseSettings):
         description="Device to run sentence transformers on (cpu, cuda, etc.)"
     )
     
+    # Write batching settings
+    store_batch_size: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum number of queued writes embedded and upserted together"
+    )
+    store_flush_ms: float = Field(
+        default=10.0,
+        ge=0.0,
+        description="Time in milliseconds to wait for more writes before flushing a batch"
+    )
+    content_cache_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Number of stored content embeddings reused for identical content"
+    )
+    
     # Search settings
     default_limit: int = Field(
         default=10,
@@ -65,6 +104,44 @@ class Settings(BaseSettings):
         le=1.0,
         description="Minimum score threshold for search results"
     )
+    search_batch_size: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum number of concurrent searches sent in one batch request"
+    )
+    search_flush_ms: float = Field(
+        default=2.0,
+        ge=0.0,
+        description="Time in milliseconds to wait for more searches before sending a batch"
+    )
+    
+    # Query cache settings
+    query_cache_size: int = Field(
+        default=1024,
+        ge=1,
+        description="Number of query embeddings kept for repeated queries"
+    )
+    semantic_cache_size: int = Field(
+        default=0,
+        ge=0,
+        description="Number of recent searches kept for semantic reuse (0 disables)"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity to reuse cached search results"
+    )
+    semantic_cache_ttl: float = Field(
+        default=60.0,
+        ge=0.0,
+        description="Seconds cached search results stay valid"
+    )
+    collection_cache_ttl: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="Seconds collection listings and collection info are cached"
+    )
     
     # Server settings
     server_name: str = Field(
@@ -76,6 +153,35 @@ class Settings(BaseSettings):
         description="Version of the MCP server"
     )
     
+    # Components of qdrant_url, parsed once at load time
+    _qdrant_host: str | None = PrivateAttr(default=None)
+    _qdrant_port: int | None = PrivateAttr(default=None)
+    _qdrant_https: bool = PrivateAttr(default=False)
+    
+    @property
+    def qdrant_host(self) -> str | None:
+        """Host name from the Qdrant URL, if it has one."""
+        return self._qdrant_host
+    
+    @property
+    def qdrant_port(self) -> int | None:
+        """Explicit port from the Qdrant URL, if any."""
+        return self._qdrant_port
+    
+    @property
+    def qdrant_https(self) -> bool:
+        """Whether the Qdrant URL uses HTTPS."""
+        return self._qdrant_https
+    
+    @model_validator(mode="after")
+    def parse_qdrant_url(self) -> "Settings":
+        """Split the Qdrant URL into host, port and scheme."""
+        parsed_url = urlparse(self.qdrant_url)
+        self._qdrant_host = parsed_url.hostname
+        self._qdrant_port = parsed_url.port
+        self._qdrant_https = parsed_url.scheme == "https"
+        return self
+    
     @field_validator("embedding_model")
     @classmethod
     def validate_embedding_model(cls, v: str, info) -> str:
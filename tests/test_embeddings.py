@@ -1,5 +1,8 @@
 """Tests for embedding providers."""
 
+import threading
+
+import numpy as np
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 
@@ -75,4 +78,34 @@ class TestOpenAIProvider:
         """Test missing API key raises error."""
         with patch.dict("os.environ", {}, clear=True):
             with pytest.raises(ValueError, match="OpenAI API key not provided"):
-                OpenAIEmbeddingProvider("text-embedding-3-small")
\ No newline at end of file
+                OpenAIEmbeddingProvider("text-embedding-3-small")
+
+class TestSentenceTransformersProvider:
+    """Test Sentence Transformers embedding provider."""
+    
+    @pytest.fixture
+    def provider(self):
+        """Provider with a mocked model."""
+        module = "qdrant_mcp.embeddings.sentence_transformers"
+        with patch(f"{module}.SENTENCE_TRANSFORMERS_AVAILABLE", True), \
+                patch(f"{module}.SentenceTransformer", create=True):
+            provider = SentenceTransformersEmbeddingProvider("all-MiniLM-L6-v2")
+        yield provider
+        provider._executor.shutdown(wait=True)
+    
+    @pytest.mark.asyncio
+    async def test_encode_runs_off_event_loop(self, provider):
+        """Encoding runs on the provider's worker thread."""
+        threads = []
+        
+        def encode(inputs, **kwargs):
+            threads.append(threading.current_thread())
+            return np.array([0.5, 0.25])
+        
+        provider.model.encode = Mock(side_effect=encode)
+        
+        result = await provider.embed_text("test text")
+        
+        assert result == [0.5, 0.25]
+        assert threads[0] is not threading.main_thread()
+        provider.model.encode.assert_called_once_with("test text", convert_to_numpy=True)
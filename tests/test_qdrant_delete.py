@@ -0,0 +1,61 @@
+"""Tests for qdrant_delete ID parsing."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from qdrant_mcp.server import qdrant_delete
+
+UUID_A = "0b8f7a2e-3c4d-4e5f-8a9b-1c2d3e4f5a6b"
+UUID_B = "9a8b7c6d-5e4f-4a3b-9c2d-1e0f9a8b7c6d"
+
+
+class TestQdrantDeleteIds:
+    """Test ID parsing and validation in qdrant_delete."""
+
+    @pytest.fixture
+    def mock_qdrant_client(self):
+        """Mock Qdrant client for testing."""
+        mock_client = AsyncMock()
+        mock_client.delete.side_effect = lambda ids, collection_name=None: {
+            "deleted": len(ids),
+            "ids": ids,
+            "collection": collection_name or "mcp_memory",
+        }
+
+        with patch('qdrant_mcp.server.qdrant_client', mock_client):
+            yield mock_client
+
+    @pytest.mark.asyncio
+    async def test_comma_and_whitespace_separated(self, mock_qdrant_client):
+        """IDs may be separated by commas, spaces or newlines."""
+        result = await qdrant_delete(ids=f" {UUID_A}, \n{UUID_B} 42,")
+
+        assert result["ids"] == [UUID_A, UUID_B, 42]
+        mock_qdrant_client.delete.assert_called_once_with(
+            [UUID_A, UUID_B, 42], collection_name=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_ids(self, mock_qdrant_client):
+        """Empty input is rejected."""
+        with pytest.raises(ValueError, match="No IDs provided"):
+            await qdrant_delete(ids=" , ")
+
+        mock_qdrant_client.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_malformed_id(self, mock_qdrant_client):
+        """IDs that are neither UUIDs nor unsigned integers are rejected."""
+        with pytest.raises(ValueError, match="Invalid ID: 'not-an-id'"):
+            await qdrant_delete(ids=f"{UUID_A},not-an-id")
+
+        mock_qdrant_client.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_non_ascii_digits_rejected(self, mock_qdrant_client):
+        """Only ASCII digit strings are accepted as integer IDs."""
+        with pytest.raises(ValueError, match="Invalid ID"):
+            await qdrant_delete(ids="٤٢")
+
+        mock_qdrant_client.delete.assert_not_called()
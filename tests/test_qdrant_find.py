@@ -0,0 +1,39 @@
+"""Tests for qdrant_find argument handling."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from qdrant_mcp.server import qdrant_find
+
+
+class TestQdrantFindArguments:
+    """Test how qdrant_find passes its arguments to the client."""
+
+    @pytest.fixture
+    def mock_qdrant_client(self):
+        """Mock Qdrant client for testing."""
+        mock_client = AsyncMock()
+        mock_client.find.return_value = {"collection": "mcp_memory", "results": []}
+
+        with patch('qdrant_mcp.server.qdrant_client', mock_client):
+            yield mock_client
+
+    @pytest.mark.asyncio
+    async def test_expected_selectivity_passed_through(self, mock_qdrant_client):
+        """The selectivity estimate reaches the client with the parsed filter."""
+        await qdrant_find(
+            query="notes",
+            filter='{"user_id": "u1"}',
+            expected_selectivity=0.001,
+        )
+
+        mock_qdrant_client.find.assert_called_once_with(
+            query="notes",
+            limit=None,
+            filter={"user_id": "u1"},
+            score_threshold=None,
+            collection_name=None,
+            exact=None,
+            expected_selectivity=0.001,
+        )
@@ -0,0 +1,730 @@
+"""Tests for the Qdrant memory client."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from qdrant_mcp.qdrant_memory import QdrantMemoryClient
+from qdrant_mcp.settings import Settings
+
+
+@pytest.fixture
+async def memory_client():
+    """QdrantMemoryClient with mocked Qdrant and embedding backends."""
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+        settings = Settings()
+
+    with patch("qdrant_mcp.qdrant_memory.AsyncQdrantClient"), \
+            patch("qdrant_mcp.qdrant_memory.create_embedding_provider"):
+        client = QdrantMemoryClient(settings)
+
+    client.client = AsyncMock()
+    client.client.get_collections.return_value = Mock(collections=[])
+
+    provider = Mock()
+    provider.model_name = "text-embedding-3-small"
+    provider.provider_name = "openai"
+    provider.dimensions = 3
+    provider.embed_text = AsyncMock(return_value=[0.1, 0.2, 0.3])
+    provider.embed_batch = AsyncMock(
+        side_effect=lambda texts: [[0.1, 0.2, 0.3] for _ in texts]
+    )
+    provider.close = AsyncMock()
+    client.embedding_provider = provider
+
+    yield client
+    await client.close()
+
+
+def _return_hits(hits):
+    """search_batch side effect answering every request with ``hits``."""
+    return lambda collection_name, requests: [list(hits) for _ in requests]
+
+
+class TestStoreBatching:
+    """Test coalescing of concurrent store calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stores_share_one_upsert(self, memory_client):
+        """Concurrent writes are embedded and upserted together."""
+        results = await asyncio.gather(
+            *(memory_client.store(f"content {i}", id=str(i)) for i in range(5))
+        )
+
+        assert [r["id"] for r in results] == list(range(5))
+        memory_client.embedding_provider.embed_batch.assert_awaited_once()
+        memory_client.client.upsert.assert_awaited_once()
+        points = memory_client.client.upsert.call_args.kwargs["points"]
+        assert [p.payload["content"] for p in points] == [
+            f"content {i}" for i in range(5)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_identical_content_is_embedded_once(self, memory_client):
+        """Re-storing identical content reuses the earlier embedding."""
+        await asyncio.gather(
+            memory_client.store("same"),
+            memory_client.store("same"),
+        )
+        await memory_client.store("same")
+        await memory_client.store("different")
+
+        embedded = [
+            call.args[0]
+            for call in memory_client.embedding_provider.embed_batch.call_args_list
+        ]
+        assert embedded == [["same"], ["different"]]
+        assert memory_client.client.upsert.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_is_split_per_collection(self, memory_client):
+        """Writes to different collections get separate upserts."""
+        await asyncio.gather(
+            memory_client.store("a", collection_name="first"),
+            memory_client.store("b", collection_name="second"),
+        )
+
+        collections = {
+            call.kwargs["collection_name"]
+            for call in memory_client.client.upsert.call_args_list
+        }
+        assert collections == {"first", "second"}
+
+    @pytest.mark.asyncio
+    async def test_upsert_error_propagates(self, memory_client):
+        """Upsert failures are raised to every waiting caller."""
+        memory_client.client.upsert.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await memory_client.store("content")
+
+    @pytest.mark.asyncio
+    async def test_invalid_id_is_rejected_before_batching(self, memory_client):
+        """A malformed ID fails its own call without touching the batch."""
+        good, bad = await asyncio.gather(
+            memory_client.store("good"),
+            memory_client.store("bad", id="my-note"),
+            return_exceptions=True,
+        )
+
+        assert good["collection"] == "mcp_memory"
+        assert isinstance(bad, ValueError)
+        points = memory_client.client.upsert.call_args.kwargs["points"]
+        assert [p.payload["content"] for p in points] == ["good"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_point_only_fails_its_caller(self, memory_client):
+        """A failed grouped upsert is retried point by point."""
+        async def upsert(collection_name, points):
+            if any(p.payload["content"] == "bad" for p in points):
+                raise RuntimeError("rejected")
+
+        memory_client.client.upsert.side_effect = upsert
+
+        good, bad = await asyncio.gather(
+            memory_client.store("good"),
+            memory_client.store("bad"),
+            return_exceptions=True,
+        )
+
+        assert good["collection"] == "mcp_memory"
+        assert isinstance(bad, RuntimeError)
+        assert memory_client.client.upsert.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_collections_are_upserted_concurrently(self, memory_client):
+        """Upserts to different collections do not wait on each other."""
+        in_flight = peak = 0
+
+        async def slow_upsert(collection_name, points):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+
+        memory_client.client.upsert.side_effect = slow_upsert
+
+        await asyncio.gather(
+            *(
+                memory_client.store(f"content {i}", collection_name=f"c{i % 4}")
+                for i in range(8)
+            )
+        )
+
+        assert peak > 1
+
+    @pytest.mark.asyncio
+    async def test_unexpected_flush_error_keeps_worker(self, memory_client):
+        """An unexpected flush failure fails its batch, not later writes."""
+        flush = memory_client._flush_store_batch
+        failures = [ValueError("bad")]
+
+        async def flaky_flush(batch):
+            if failures:
+                raise failures.pop()
+            await flush(batch)
+
+        memory_client._flush_store_batch = flaky_flush
+
+        with pytest.raises(ValueError, match="bad"):
+            await memory_client.store("content")
+        result = await memory_client.store("content")
+        assert result["collection"] == "mcp_memory"
+
+    @pytest.mark.asyncio
+    async def test_close_fails_in_flight_and_queued_writes(self, memory_client):
+        """Closing the client fails writes that have not completed."""
+        upsert_started = asyncio.Event()
+
+        async def hang(**kwargs):
+            upsert_started.set()
+            await asyncio.Event().wait()
+
+        memory_client.client.upsert.side_effect = hang
+        memory_client.settings.store_batch_size = 1
+
+        in_flight = asyncio.create_task(memory_client.store("first"))
+        await upsert_started.wait()
+        queued = asyncio.create_task(memory_client.store("second"))
+        await asyncio.sleep(0)
+
+        await memory_client.close()
+
+        for task in (in_flight, queued):
+            with pytest.raises(RuntimeError, match="client closed"):
+                await asyncio.wait_for(task, 1)
+
+
+class TestQueryCache:
+    """Test query embedding and semantic result caching in find."""
+
+    @pytest.fixture(autouse=True)
+    def semantic_cache(self, memory_client):
+        """Enable the semantic result cache."""
+        memory_client.settings.semantic_cache_size = 256
+
+    @pytest.fixture
+    def search_hit(self):
+        """A single search hit returned by Qdrant."""
+        return Mock(id="hit-1", score=0.9, payload={"content": "cached"})
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_reuses_embedding_and_results(
+        self, memory_client, search_hit
+    ):
+        """An identical query skips both embedding and search."""
+        memory_client.client.search_batch.side_effect = _return_hits([search_hit])
+
+        first = await memory_client.find("what is cached?")
+        second = await memory_client.find("what is cached?")
+
+        assert first == second
+        memory_client.embedding_provider.embed_text.assert_awaited_once()
+        memory_client.client.search_batch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_query_misses(self, memory_client, search_hit):
+        """A query pointing elsewhere in vector space runs a new search."""
+        memory_client.client.search_batch.side_effect = _return_hits([search_hit])
+        memory_client.embedding_provider.embed_text.side_effect = [
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+        ]
+
+        await memory_client.find("first")
+        await memory_client.find("second")
+
+        assert memory_client.client.search_batch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_parameters_are_part_of_key(self, memory_client, search_hit):
+        """Cached results are not shared across collections or filters."""
+        memory_client.client.search_batch.side_effect = _return_hits([search_hit])
+
+        await memory_client.find("query")
+        await memory_client.find("query", collection_name="other")
+        await memory_client.find("query", filter={"type": "note"})
+
+        assert memory_client.client.search_batch.await_count == 3
+        memory_client.embedding_provider.embed_text.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_results(self, memory_client, search_hit):
+        """Deleting from a collection clears its cached results."""
+        memory_client.client.search_batch.side_effect = _return_hits([search_hit])
+
+        await memory_client.find("query")
+        await memory_client.delete(["hit-1"])
+        await memory_client.find("query")
+
+        assert memory_client.client.search_batch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_shard_still_invalidates(self, memory_client, search_hit):
+        """Cached results are dropped even when one delete shard fails."""
+        memory_client.client.search_batch.side_effect = _return_hits([search_hit])
+        memory_client.client.delete.side_effect = [None, RuntimeError("boom"), None]
+
+        await memory_client.find("query")
+        with pytest.raises(RuntimeError, match="boom"):
+            await memory_client.delete([f"id-{i}" for i in range(2500)])
+        await memory_client.find("query")
+
+        assert memory_client.client.delete.await_count == 3
+        assert memory_client.client.search_batch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_racing_a_write_is_not_cached(
+        self, memory_client, search_hit
+    ):
+        """Results of a search that overlapped a write are not cached."""
+        release = asyncio.Event()
+
+        async def slow_search(collection_name, requests):
+            await release.wait()
+            return [[search_hit] for _ in requests]
+
+        memory_client.client.search_batch.side_effect = slow_search
+
+        pending = asyncio.create_task(memory_client.find("query"))
+        await asyncio.sleep(0.05)
+        await memory_client.delete(["hit-1"])
+        release.set()
+        await pending
+        await memory_client.find("query")
+
+        assert memory_client.client.search_batch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_disabled(self, memory_client, search_hit):
+        """Setting SEMANTIC_CACHE_SIZE to 0 always searches."""
+        memory_client.settings.semantic_cache_size = 0
+        memory_client.client.search_batch.side_effect = _return_hits([search_hit])
+
+        await memory_client.find("query")
+        await memory_client.find("query")
+
+        assert memory_client.client.search_batch.await_count == 2
+
+
+class TestFindFormatting:
+    """Test formatting of search hits."""
+
+    @pytest.mark.asyncio
+    async def test_requests_only_result_fields(self, memory_client):
+        """Only the payload fields used in results are requested."""
+        memory_client.client.search_batch.side_effect = _return_hits(
+            [Mock(id="a", score=0.5, payload=None)]
+        )
+
+        results = await memory_client.find("query")
+
+        request = memory_client.client.search_batch.call_args.kwargs["requests"][0]
+        assert request.with_payload == ["content", "timestamp", "metadata"]
+        assert results == {
+            "collection": "mcp_memory",
+            "embedding_model": "text-embedding-3-small",
+            "embedding_provider": "openai",
+            "results": [{
+                "id": "a",
+                "score": 0.5,
+                "content": "",
+                "timestamp": "",
+                "metadata": {},
+            }],
+        }
+
+
+class TestEnsureCollection:
+    """Test lazy collection creation."""
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_collection(self, memory_client):
+        """A missing collection is created without quantization by default."""
+        await memory_client._ensure_collection("notes")
+
+        memory_client.client.create_collection.assert_awaited_once()
+        kwargs = memory_client.client.create_collection.call_args.kwargs
+        assert kwargs["collection_name"] == "notes"
+        assert kwargs["vectors_config"].size == 3
+        assert kwargs["quantization_config"] is None
+
+    @pytest.mark.asyncio
+    async def test_quantized_collection(self, memory_client):
+        """QUANTIZE creates collections with int8 scalar quantization."""
+        memory_client.settings.quantize = True
+
+        await memory_client._ensure_collection("notes")
+
+        kwargs = memory_client.client.create_collection.call_args.kwargs
+        scalar = kwargs["quantization_config"].scalar
+        assert scalar.type == "int8"
+        assert scalar.always_ram is True
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_use_checks_once(self, memory_client):
+        """Concurrent first calls share one get_collections round-trip."""
+        await asyncio.gather(
+            *(memory_client._ensure_collection("notes") for _ in range(10))
+        )
+        await memory_client._ensure_collection("notes")
+
+        memory_client.client.get_collections.assert_awaited_once()
+        memory_client.client.create_collection.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_retried(self, memory_client):
+        """A failed initialization is not cached."""
+        memory_client.client.get_collections.side_effect = [
+            ConnectionError("down"),
+            Mock(collections=[]),
+        ]
+
+        with pytest.raises(RuntimeError, match="Failed to initialize"):
+            await memory_client._ensure_collection("notes")
+        await memory_client._ensure_collection("notes")
+
+        memory_client.client.create_collection.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_indexes_payload_keys_on_create(self, memory_client):
+        """Configured metadata keys get keyword indexes on a new collection."""
+        memory_client.settings.indexed_payload_keys = ["user_id", "category"]
+
+        await memory_client._ensure_collection("notes")
+
+        field_names = [
+            call.kwargs["field_name"]
+            for call in memory_client.client.create_payload_index.call_args_list
+        ]
+        assert field_names == ["metadata.user_id", "metadata.category"]
+
+    @pytest.mark.asyncio
+    async def test_indexes_only_missing_keys_on_existing(self, memory_client):
+        """Existing collections only get indexes they are missing."""
+        existing = Mock()
+        existing.name = "notes"
+        memory_client.client.get_collections.return_value = Mock(collections=[existing])
+        memory_client.client.get_collection.return_value = Mock(
+            payload_schema={"metadata.user_id": Mock()}
+        )
+        memory_client.settings.indexed_payload_keys = ["user_id", "category"]
+
+        await memory_client._ensure_collection("notes")
+
+        memory_client.client.create_collection.assert_not_awaited()
+        memory_client.client.create_payload_index.assert_awaited_once()
+        assert memory_client.client.create_payload_index.call_args.kwargs[
+            "field_name"
+        ] == "metadata.category"
+
+
+class TestStoreCollectionInit:
+    """Test collection initialization from the store worker."""
+
+    @pytest.mark.asyncio
+    async def test_init_failure_only_fails_its_collection(self, memory_client):
+        """A collection that cannot be created fails only its own writes."""
+        async def ensure(collection_name):
+            if collection_name == "broken":
+                raise RuntimeError("Failed to initialize Qdrant collection 'broken'")
+
+        memory_client._ensure_collection = ensure
+
+        ok, failed = await asyncio.gather(
+            memory_client.store("a", collection_name="fine"),
+            memory_client.store("b", collection_name="broken"),
+            return_exceptions=True,
+        )
+
+        assert ok["collection"] == "fine"
+        assert isinstance(failed, RuntimeError)
+        memory_client.client.upsert.assert_awaited_once()
+
+
+class TestDelete:
+    """Test point deletion."""
+
+    @pytest.mark.asyncio
+    async def test_large_delete_is_sharded(self, memory_client):
+        """Large ID lists are split into fixed-size delete requests."""
+        ids = [f"id-{i}" for i in range(2500)]
+
+        result = await memory_client.delete(ids)
+
+        selectors = [
+            call.kwargs["points_selector"]
+            for call in memory_client.client.delete.call_args_list
+        ]
+        assert [len(s) for s in selectors] == [1000, 1000, 500]
+        assert sum(selectors, []) == ids
+        assert result["deleted"] == 2500
+
+
+class TestSearchBatching:
+    """Test coalescing of concurrent find calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_finds_share_one_request(self, memory_client):
+        """Concurrent queries on a collection go out as one search_batch."""
+        memory_client.settings.semantic_cache_size = 0
+        memory_client.client.search_batch.side_effect = (
+            lambda collection_name, requests: [
+                [Mock(id=str(i), score=1.0, payload={"content": f"hit {i}"})]
+                for i in range(len(requests))
+            ]
+        )
+
+        results = await asyncio.gather(
+            *(memory_client.find(f"query {i}", limit=i + 1) for i in range(3))
+        )
+
+        memory_client.client.search_batch.assert_awaited_once()
+        requests = memory_client.client.search_batch.call_args.kwargs["requests"]
+        assert [r.limit for r in requests] == [1, 2, 3]
+        assert [r["results"][0]["content"] for r in results] == [
+            "hit 0", "hit 1", "hit 2"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_searches_run_concurrently(self, memory_client):
+        """Batches and collections do not wait on each other's requests."""
+        memory_client.settings.search_batch_size = 2
+        in_flight = peak = 0
+
+        async def slow_search(collection_name, requests):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return [[] for _ in requests]
+
+        memory_client.client.search_batch.side_effect = slow_search
+
+        await asyncio.gather(
+            *(
+                memory_client.find(f"query {i}", collection_name=f"c{i % 4}")
+                for i in range(16)
+            )
+        )
+
+        assert peak > 1
+
+    @pytest.mark.asyncio
+    async def test_search_error_propagates(self, memory_client):
+        """search_batch failures are raised to the waiting callers."""
+        memory_client.client.search_batch.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await memory_client.find("query")
+
+
+class TestCollectionCache:
+    """Test short-lived caching of collection listings and info."""
+
+    @pytest.fixture
+    def collection_info(self):
+        """Collection info as returned by Qdrant."""
+        info = Mock(vectors_count=1, points_count=1)
+        info.config.params.vectors.size = 3
+        info.config.params.vectors.distance = "Cosine"
+        return info
+
+    @pytest.mark.asyncio
+    async def test_list_collections_is_cached(self, memory_client):
+        """Repeated listings within the TTL reuse the first response."""
+        first = Mock()
+        first.name = "notes"
+        memory_client.client.get_collections.return_value = Mock(collections=[first])
+
+        assert await memory_client.list_collections() == ["notes"]
+        assert await memory_client.list_collections() == ["notes"]
+
+        memory_client.client.get_collections.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_list_collections_expires(self, memory_client):
+        """A zero TTL always asks Qdrant."""
+        memory_client.settings.collection_cache_ttl = 0.0
+
+        await memory_client.list_collections()
+        await memory_client.list_collections()
+
+        assert memory_client.client.get_collections.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_collection_info_is_cached_until_write(
+        self, memory_client, collection_info
+    ):
+        """Collection info is cached per collection and dropped on writes."""
+        memory_client.client.get_collection.return_value = collection_info
+
+        await memory_client.get_collection_info()
+        await memory_client.get_collection_info()
+        assert memory_client.client.get_collection.await_count == 1
+
+        await memory_client.delete(["1"])
+        info = await memory_client.get_collection_info()
+
+        assert memory_client.client.get_collection.await_count == 2
+        assert info["name"] == "mcp_memory"
+
+
+class TestBulkLoad:
+    """Test deferred indexing during bulk loads."""
+
+    @pytest.fixture(autouse=True)
+    def indexing_threshold(self, memory_client):
+        """Report a custom indexing threshold for every collection."""
+        info = Mock()
+        info.config.optimizer_config.indexing_threshold = 5000
+        memory_client.client.get_collection.return_value = info
+        return info
+
+    @pytest.mark.asyncio
+    async def test_indexing_disabled_then_restored(self, memory_client):
+        """Indexing is turned off inside the block and restored after."""
+        update = memory_client.client.update_collection
+
+        async with memory_client.bulk_load("notes") as collection:
+            assert collection == "notes"
+            assert update.call_args.kwargs["optimizer_config"].indexing_threshold == 0
+            await memory_client.store("content", collection_name="notes")
+
+        assert update.await_count == 2
+        assert update.call_args.kwargs["collection_name"] == "notes"
+        assert update.call_args.kwargs["optimizer_config"].indexing_threshold == 5000
+
+    @pytest.mark.asyncio
+    async def test_indexing_restored_on_error(self, memory_client):
+        """Indexing is restored even if the load fails."""
+        with pytest.raises(RuntimeError):
+            async with memory_client.bulk_load():
+                raise RuntimeError("load failed")
+
+        kwargs = memory_client.client.update_collection.call_args.kwargs
+        assert kwargs["collection_name"] == "mcp_memory"
+        assert kwargs["optimizer_config"].indexing_threshold == 5000
+
+    @pytest.mark.asyncio
+    async def test_unset_threshold_restores_default(
+        self, memory_client, indexing_threshold
+    ):
+        """Collections without their own threshold get Qdrant's default back."""
+        indexing_threshold.config.optimizer_config.indexing_threshold = None
+
+        async with memory_client.bulk_load():
+            pass
+
+        kwargs = memory_client.client.update_collection.call_args.kwargs
+        assert kwargs["optimizer_config"].indexing_threshold == 20000
+
+    @pytest.mark.asyncio
+    async def test_overlapping_loads_restore_once(self, memory_client):
+        """Indexing stays off until the last overlapping load exits."""
+        update = memory_client.client.update_collection
+
+        async with memory_client.bulk_load("notes"):
+            async with memory_client.bulk_load("notes"):
+                pass
+            assert update.await_count == 1
+
+        assert update.await_count == 2
+        assert update.call_args.kwargs["optimizer_config"].indexing_threshold == 5000
+        memory_client.client.get_collection.assert_awaited_once()
+
+
+class TestExactSearch:
+    """Test exact search selection in find."""
+
+    @pytest.fixture(autouse=True)
+    def no_hits(self, memory_client):
+        """Answer every search with no hits."""
+        memory_client.client.search_batch.side_effect = _return_hits([])
+
+    def _params(self, memory_client):
+        return memory_client.client.search_batch.call_args.kwargs["requests"][0].params
+
+    @pytest.mark.asyncio
+    async def test_approximate_by_default(self, memory_client):
+        """Searches use the vector index unless asked otherwise."""
+        await memory_client.find("query", filter={"user_id": "u1"})
+
+        assert self._params(memory_client) is None
+
+    @pytest.mark.asyncio
+    async def test_explicit_exact(self, memory_client):
+        """exact=True requests an exact search."""
+        await memory_client.find("query", exact=True)
+
+        assert self._params(memory_client).exact is True
+
+    @pytest.mark.asyncio
+    async def test_selective_indexed_filter_is_exact(self, memory_client):
+        """A highly selective filter on an indexed key switches to exact."""
+        memory_client.settings.indexed_payload_keys = ["user_id"]
+
+        await memory_client.find(
+            "query", filter={"user_id": "u1"}, expected_selectivity=0.001
+        )
+
+        assert self._params(memory_client).exact is True
+
+    @pytest.mark.asyncio
+    async def test_unindexed_filter_stays_approximate(self, memory_client):
+        """Selectivity alone is not enough without a payload index."""
+        await memory_client.find(
+            "query", filter={"user_id": "u1"}, expected_selectivity=0.001
+        )
+
+        assert self._params(memory_client) is None
+
+
+class TestTransport:
+    """Test construction of the underlying Qdrant client."""
+
+    def _construct(self, url, **overrides):
+        """Build a client for ``url`` and return the kwargs Qdrant got."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            settings = Settings(qdrant_url=url, pool_size=8, **overrides)
+
+        with patch("qdrant_mcp.qdrant_memory.AsyncQdrantClient") as qdrant, \
+                patch("qdrant_mcp.qdrant_memory.create_embedding_provider"):
+            QdrantMemoryClient(settings)
+
+        qdrant.assert_called_once()
+        kwargs = qdrant.call_args.kwargs
+        assert kwargs["limits"].max_connections == 8
+        assert kwargs["limits"].max_keepalive_connections == 8
+        return kwargs
+
+    def test_http_uses_grpc(self):
+        """Plain HTTP URLs talk gRPC on the configured port."""
+        kwargs = self._construct("http://localhost:6333", qdrant_grpc_port=7334)
+
+        assert kwargs["host"] == "localhost"
+        assert kwargs["https"] is False
+        assert kwargs["prefer_grpc"] is True
+        assert kwargs["grpc_port"] == 7334
+        assert "http2" not in kwargs
+
+    def test_https_uses_rest_over_http2(self):
+        """HTTPS URLs stay on REST, over HTTP/2."""
+        kwargs = self._construct("https://example.qdrant.io")
+
+        assert kwargs["host"] == "example.qdrant.io"
+        assert kwargs["port"] == 443
+        assert kwargs["https"] is True
+        assert kwargs["prefer_grpc"] is False
+        assert kwargs["http2"] is True
+
+    def test_url_fallback(self):
+        """URLs without a host name are passed through as is."""
+        kwargs = self._construct(":memory:", prefer_grpc=False)
+
+        assert kwargs["url"] == ":memory:"
+        assert kwargs["prefer_grpc"] is False
+        assert kwargs["grpc_port"] == 6334
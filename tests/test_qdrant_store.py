@@ -107,6 +107,31 @@ class TestQdrantStoreMetadataValidation:
         
         assert "Invalid JSON in metadata" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_metadata_oversized_int_string(self, mock_qdrant_client):
+        """Test metadata with an integer wider than 64 bits."""
+        metadata = '{"big": 123456789012345678901234567890}'
+        
+        with pytest.raises(ValueError) as exc_info:
+            await qdrant_store(content="Test", metadata=metadata)
+        
+        assert "Integer exceeds 64-bit range" in str(exc_info.value)
+        mock_qdrant_client.store.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_metadata_string_with_floats_and_large_ints(self, mock_qdrant_client):
+        """Test metadata mixing floats with integers at the 64-bit limits."""
+        metadata = '{"score": 0.5, "ids": [18446744073709551615, -9223372036854775808]}'
+        
+        await qdrant_store(content="Test", metadata=metadata)
+        
+        stored = mock_qdrant_client.store.call_args.kwargs["metadata"]
+        assert stored == {
+            "score": 0.5,
+            "ids": [18446744073709551615, -9223372036854775808],
+        }
+        assert all(isinstance(i, int) for i in stored["ids"])
+
     @pytest.mark.asyncio
     async def test_metadata_non_serializable_dict(self, mock_qdrant_client):
         """Test metadata with non-serializable objects."""
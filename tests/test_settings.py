@@ -19,6 +19,39 @@ class TestSettings:
             assert settings.embedding_model == "text-embedding-3-small"
             assert settings.default_limit == 10
     
+    def test_connection_settings(self):
+        """Test Qdrant transport settings defaults and overrides."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            settings = Settings()
+            assert settings.prefer_grpc is True
+            assert settings.qdrant_grpc_port == 6334
+            assert settings.pool_size == 100
+        
+        env_vars = {
+            "OPENAI_API_KEY": "test-key",
+            "PREFER_GRPC": "false",
+            "QDRANT_GRPC_PORT": "7334",
+            "POOL_SIZE": "8",
+        }
+        with patch.dict("os.environ", env_vars):
+            settings = Settings()
+            assert settings.prefer_grpc is False
+            assert settings.qdrant_grpc_port == 7334
+            assert settings.pool_size == 8
+    
+    def test_qdrant_url_components(self):
+        """Test Qdrant URL is split into host, port and scheme."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            settings = Settings(qdrant_url="https://example.qdrant.io:6334")
+            assert settings.qdrant_host == "example.qdrant.io"
+            assert settings.qdrant_port == 6334
+            assert settings.qdrant_https is True
+            
+            settings = Settings(qdrant_url="http://localhost")
+            assert settings.qdrant_host == "localhost"
+            assert settings.qdrant_port is None
+            assert settings.qdrant_https is False
+    
     def test_environment_variables(self):
         """Test loading settings from environment."""
         env_vars = {